@@ -48,6 +48,12 @@ class Settings(BaseSettings):
         default=1440,  # 24 hours
         description="JWT token expiration time in minutes"
     )
+
+    # Password Hashing
+    bcrypt_rounds: int = Field(
+        default=12,
+        description="bcrypt cost factor for password hashing (lowered to 4 in tests)"
+    )
     
     # CORS
     cors_origins: List[str] = Field(
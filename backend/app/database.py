@@ -5,6 +5,7 @@ Provides async SQLAlchemy engine, session factory, and dependency injection
 for database sessions in FastAPI endpoints.
 """
 import os
+from functools import lru_cache
 from typing import AsyncGenerator
 
 from sqlalchemy.ext.asyncio import (
@@ -23,13 +24,24 @@ DATABASE_URL = os.getenv("DATABASE_URL", "postgresql+asyncpg://tagmaster:tagmast
 # Create async engine
 # echo=True enables SQL query logging (useful for development)
 # pool_pre_ping=True ensures connections are alive before using them
-engine: AsyncEngine = create_async_engine(
-    DATABASE_URL,
-    echo=False,  # Set to True for SQL query debugging
-    pool_pre_ping=True,
-    pool_size=20,
-    max_overflow=10,
-)
+@lru_cache(maxsize=None)
+def _get_engine(url: str) -> AsyncEngine:
+    """
+    Create (or return the already-built) async engine for the given URL.
+
+    Memoized so repeated calls with the same URL share one connection pool
+    instead of constructing a new engine each time.
+    """
+    return create_async_engine(
+        url,
+        echo=False,  # Set to True for SQL query debugging
+        pool_pre_ping=True,
+        pool_size=20,
+        max_overflow=10,
+    )
+
+
+engine: AsyncEngine = _get_engine(DATABASE_URL)
 
 # Session factory for creating database sessions
 AsyncSessionLocal = async_sessionmaker(
@@ -6,11 +6,12 @@ Creates and configures the FastAPI application with all middleware, routers, and
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
+from fastapi.middleware.gzip import GZipMiddleware
 
 from app.config import settings
 from app.database import close_db, init_db
 from app.middleware.cors import configure_cors
-from app.middleware.error_handler import ErrorHandlerMiddleware
+from app.middleware.error_handler import unhandled_exception_handler
 from app.middleware.logging import LoggingMiddleware
 from app.middleware.rate_limit import RateLimitMiddleware
 from app.api.v1.health import router as health_router
@@ -25,7 +26,14 @@ async def lifespan(app: FastAPI):
     """
     # Startup: Initialize database (optional - use Alembic migrations in production)
     # await init_db()  # Uncomment for testing without migrations
-    
+
+    # Build deferred response schemas now so the first request that
+    # serializes them doesn't pay the pydantic-core schema build.
+    from app.schemas.player import ErrorResponse, PlayerListResponse, TokenResponse
+
+    for _model in (TokenResponse, PlayerListResponse, ErrorResponse):
+        _model.model_rebuild()
+
     yield
     
     # Shutdown: Close database connections
@@ -46,9 +54,16 @@ app = FastAPI(
 configure_cors(app)
 
 # Add middleware (order matters - first added is outermost layer)
-app.add_middleware(ErrorHandlerMiddleware)  # Catch all unhandled exceptions
 app.add_middleware(LoggingMiddleware)  # Log all requests/responses
 app.add_middleware(RateLimitMiddleware)  # Rate limiting per user
+# Compress responses >=1KB. Covers normal responses only: unhandled-
+# exception bodies come from Starlette's ServerErrorMiddleware, which
+# sits outside every add_middleware layer (they are tiny anyway).
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
+# Catch all unhandled exceptions; runs inline in Starlette's server-error
+# layer instead of as another middleware hop
+app.add_exception_handler(Exception, unhandled_exception_handler)
 
 # Include routers
 app.include_router(health_router, prefix="", tags=["health"])
@@ -1,63 +1,59 @@
 """
-Global error handling middleware.
+Global error handling for unhandled exceptions.
 
-Catches all unhandled exceptions and returns consistent error responses.
+Registered as a FastAPI exception handler so clients always receive
+consistent JSON error responses even when unexpected errors occur.
 """
-import traceback
-from typing import Union
-
 from fastapi import Request, status
-from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi.responses import Response
 
 from app.middleware.logging import get_logger
 
 logger = get_logger(__name__)
 
+# The 500 payload shape is constant; only two values vary, and both are safe
+# to splice in raw (request ids are hex or "unknown", error types are Python
+# class names), so the body can be assembled with one bytes interpolation
+# instead of building and serializing a dict per error.
+_ERR_TEMPLATE = (
+    b'{"detail":"An unexpected error occurred. Please try again later.",'
+    b'"request_id":"%s","error_type":"%s"}'
+)
+
 
-class ErrorHandlerMiddleware(BaseHTTPMiddleware):
+async def unhandled_exception_handler(request: Request, exc: Exception) -> Response:
     """
-    Middleware that catches all unhandled exceptions and returns structured error responses.
-    
-    Ensures clients always receive JSON error responses even when unexpected errors occur.
+    Turn any unhandled exception into a structured 500 response.
+
+    Registered via app.add_exception_handler(Exception, ...), which
+    Starlette runs inline in its server-error layer — no middleware round
+    trip or extra task on the success path, unlike the BaseHTTPMiddleware
+    error handler this replaces.
+
+    Args:
+        request: The request that triggered the exception
+        exc: The unhandled exception
+
+    Returns:
+        Generic JSON error response with correlation id
     """
-    
-    async def dispatch(self, request: Request, call_next):
-        """
-        Catch and handle all exceptions.
-        
-        Args:
-            request: Incoming HTTP request
-            call_next: Next middleware/endpoint in chain
-            
-        Returns:
-            Response from endpoint or error response
-        """
-        try:
-            response = await call_next(request)
-            return response
-            
-        except Exception as exc:
-            # Get request ID for correlation
-            request_id = getattr(request.state, "request_id", "unknown")
-            
-            # Log error without PII
-            logger.error(
-                "unhandled_exception",
-                request_id=request_id,
-                method=request.method,
-                path=request.url.path,
-                error_type=type(exc).__name__,
-                error_message=str(exc),
-                exc_info=True
-            )
-            
-            # Return generic error response
-            return JSONResponse(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                content={
-                    "detail": "An unexpected error occurred. Please try again later.",
-                    "request_id": request_id,
-                    "error_type": type(exc).__name__
-                }
-            )
+    # Get request ID for correlation (set by LoggingMiddleware)
+    request_id = getattr(request.state, "request_id", "unknown")
+
+    # Log error without PII
+    logger.error(
+        "unhandled_exception",
+        request_id=request_id,
+        method=request.method,
+        path=request.url.path,
+        error_type=type(exc).__name__,
+        error_message=str(exc),
+        exc_info=True
+    )
+
+    # Return generic error response from the precomputed template
+    return Response(
+        content=_ERR_TEMPLATE % (request_id.encode(), type(exc).__name__.encode()),
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        media_type="application/json"
+    )
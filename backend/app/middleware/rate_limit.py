@@ -3,136 +3,266 @@ Rate limiting middleware using token bucket algorithm.
 
 Implements in-memory rate limiting with 50 requests per minute per user.
 """
-import time
-from collections import defaultdict
-from typing import Callable, Dict, Tuple
+import json
+from collections import OrderedDict
+from time import monotonic as _now
+from typing import Optional, Tuple
 
-from fastapi import Request, Response, status
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import JSONResponse
+from fastapi import status
 
 from app.config import settings
 
+# Endpoints exempt from rate limiting (probes and scrapers): one hashed
+# frozenset membership test instead of chained string compares.
+_SKIP_PATHS: frozenset = frozenset({"/health", "/metrics"})
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
+# Token counts are stored as integers scaled by this factor (micro-
+# tokens). Integer arithmetic keeps the bucket state exact — consuming
+# and refilling never accumulate float rounding error — and small-int
+# ops skip the boxed-float allocation per operation.
+_SCALE = 1_000_000
+
+
+def _identify(scope) -> Tuple[str, str]:
+    """
+    Get the rate-limit identifier for a connection scope.
+
+    Prefers the user ID placed in scope state by the auth middleware,
+    falls back to the client IP. A free function over dict lookups: no
+    attribute-descriptor machinery and no bound-method call on the hot
+    path. Returns a ("user"|"ip", value) tuple rather than a formatted
+    string: the kind literals are interned, both elements carry cached
+    hashes, and no new string is allocated per request just to key the
+    bucket dict.
+    """
+    state = scope.get("state")
+    if state is not None:
+        user_id = state.get("user_id") if isinstance(state, dict) else getattr(state, "user_id", None)
+        if user_id is not None:
+            return ("user", user_id)
+
+    # Fallback to client IP address
+    client = scope.get("client")
+    return ("ip", client[0]) if client else ("ip", "unknown")
+
+
+def _id_str(identifier: Tuple[str, str]) -> str:
+    """Render an identifier tuple as the human-readable kind:value form."""
+    return f"{identifier[0]}:{identifier[1]}"
+
+
+class RateLimitMiddleware:
     """
     Token bucket rate limiting middleware.
-    
+
     Tracks request counts per user (identified by IP or user ID) and enforces
     rate limits based on configuration.
-    
+
+    Implemented as pure ASGI rather than BaseHTTPMiddleware: no per-request
+    task group, Request/Response materialization, or response body re-read —
+    the happy path only wraps `send` to append the rate-limit headers.
+
     Algorithm: Token Bucket
     - Each user has a bucket with N tokens
     - Each request consumes 1 token
     - Tokens refill at a constant rate
     - If bucket is empty, request is rejected
     """
-    
+
     def __init__(self, app):
-        super().__init__(app)
-        # Store: {identifier: (token_count, last_refill_time)}
-        self.buckets: Dict[str, Tuple[float, float]] = defaultdict(
-            lambda: (float(settings.rate_limit_per_minute), time.time())
-        )
+        self.app = app
+        # Store: {identifier: (tokens_q, last_refill_time)} with token
+        # counts in integer micro-tokens (see _SCALE), kept in
+        # least-recently-used order. Not a defaultdict: the default
+        # factory would materialize a bucket on every read miss, so any
+        # read-only lookup could grow the table for transient identifiers.
+        # Anonymous clients key by source IP, so without a bound a scan
+        # from many addresses would grow this dict forever; capacity
+        # eviction plus a periodic stale sweep keeps memory O(active
+        # clients). Evicting a stale bucket is free: by the time an entry
+        # has idled past full refill, recreating it loses nothing.
+        self.buckets: "OrderedDict[Tuple[str, str], Tuple[int, float]]" = OrderedDict()
+        self.max_buckets = 16384
+        self._calls = 0
         self.rate_limit = settings.rate_limit_per_minute
-        self.refill_rate = self.rate_limit / 60.0  # tokens per second
-    
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        self.capacity_q = self.rate_limit * _SCALE
+        self.refill_per_sec_q = (self.rate_limit * _SCALE) // 60  # micro-tokens per second
+        # Constant response headers, encoded once for the process
+        # lifetime; per request only the remaining-count value changes.
+        self._h_limit = (b"x-ratelimit-limit", str(self.rate_limit).encode())
+        self._h_reset = (b"x-ratelimit-reset", b"60")
+        self._h_retry_after = (b"retry-after", b"60")
+        # The remaining count only takes rate_limit + 1 distinct values,
+        # so encode them all up front instead of str + encode per request.
+        self._remaining_cache = tuple(
+            str(i).encode() for i in range(self.rate_limit + 1)
+        )
+        # The 429 response never varies, so serialize it once here: the
+        # blocked branch sends these two prebuilt messages as-is instead
+        # of running json.dumps and building a headers list per request.
+        body = json.dumps({
+            "detail": f"Rate limit exceeded. Maximum {self.rate_limit} requests per minute.",
+            "retry_after": 60  # seconds
+        }).encode()
+        self._429_start = {
+            "type": "http.response.start",
+            "status": status.HTTP_429_TOO_MANY_REQUESTS,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                self._h_retry_after,
+                self._h_limit,
+                (b"x-ratelimit-remaining", b"0"),
+                self._h_reset,
+            ],
+        }
+        self._429_body = {"type": "http.response.body", "body": body}
+
+    async def __call__(self, scope, receive, send) -> None:
         """
         Process each request and enforce rate limiting.
-        
-        Args:
-            request: Incoming HTTP request
-            call_next: Next middleware/endpoint in chain
-            
-        Returns:
-            Response from endpoint or 429 rate limit error
+
+        Passes lifespan/websocket scopes straight through; for HTTP either
+        forwards to the inner app with rate-limit headers appended to the
+        response start message, or short-circuits with a 429.
         """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         # Skip rate limiting for health check endpoints
-        if request.url.path in ["/health", "/metrics"]:
-            return await call_next(request)
-        
+        if scope["path"] in _SKIP_PATHS:
+            await self.app(scope, receive, send)
+            return
+
         # Identify user (prefer user ID from JWT, fallback to IP)
-        identifier = self._get_identifier(request)
-        
-        # Check and update rate limit
-        if not self._check_rate_limit(identifier):
-            return JSONResponse(
-                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                content={
-                    "detail": f"Rate limit exceeded. Maximum {self.rate_limit} requests per minute.",
-                    "retry_after": 60  # seconds
-                },
-                headers={"Retry-After": "60"}
-            )
-        
+        identifier = _identify(scope)
+
+        # Check and update rate limit; one clock read per request
+        if not self._check_rate_limit(identifier, _now()):
+            await send(self._429_start)
+            await send(self._429_body)
+            return
+
+        remaining = self.buckets[identifier][0] // _SCALE
+        # Built once per request, outside the wrapper: only the
+        # remaining-count value varies between requests.
+        extra_headers = (
+            self._h_limit,
+            (b"x-ratelimit-remaining",
+             self._remaining_cache[min(remaining, self.rate_limit)]),
+            self._h_reset,
+        )
+
+        async def send_with_headers(message) -> None:
+            # Add rate limit headers to the response start message
+            if message["type"] == "http.response.start":
+                message.setdefault("headers", []).extend(extra_headers)
+            await send(message)
+
         # Process request
-        response = await call_next(request)
-        
-        # Add rate limit headers to response
-        remaining = int(self.buckets[identifier][0])
-        response.headers["X-RateLimit-Limit"] = str(self.rate_limit)
-        response.headers["X-RateLimit-Remaining"] = str(max(0, remaining))
-        response.headers["X-RateLimit-Reset"] = str(int(time.time()) + 60)
-        
-        return response
-    
-    def _get_identifier(self, request: Request) -> str:
-        """
-        Get unique identifier for rate limiting.
-        
-        Prefers user ID from JWT token, falls back to IP address.
-        
-        Args:
-            request: Incoming HTTP request
-            
-        Returns:
-            Unique identifier string
-        """
-        # Try to extract user ID from request state (set by auth middleware)
-        if hasattr(request.state, "user_id"):
-            return f"user:{request.state.user_id}"
-        
-        # Fallback to client IP address
-        client_host = request.client.host if request.client else "unknown"
-        return f"ip:{client_host}"
-    
-    def _check_rate_limit(self, identifier: str) -> bool:
+        await self.app(scope, receive, send_with_headers)
+
+    def _check_rate_limit(self, identifier: Tuple[str, str], now: Optional[float] = None) -> bool:
         """
         Check if request is within rate limit using token bucket algorithm.
-        
+
+        Bucket timestamps use the monotonic clock: refill math is immune
+        to wall-clock jumps (NTP steps, DST) and the caller can capture
+        one tick per request and pass it in.
+
+        Concurrency: the whole read-modify-write is pure Python
+        arithmetic between one dict read and one tuple store, so the GIL
+        makes it atomic with respect to other coroutines — no per-bucket
+        lock is needed (the method never awaits).
+
         Args:
             identifier: Unique user/IP identifier
-            
+            now: Monotonic timestamp; read from the clock when omitted
+
         Returns:
             True if request allowed, False if rate limit exceeded
         """
-        current_time = time.time()
-        tokens, last_refill = self.buckets[identifier]
-        
-        # Refill tokens based on elapsed time
-        time_elapsed = current_time - last_refill
-        tokens_to_add = time_elapsed * self.refill_rate
-        tokens = min(self.rate_limit, tokens + tokens_to_add)
-        
-        # Check if enough tokens available
-        if tokens < 1.0:
-            # Update bucket state (no token consumed)
-            self.buckets[identifier] = (tokens, current_time)
-            return False
-        
-        # Consume one token
-        tokens -= 1.0
-        self.buckets[identifier] = (tokens, current_time)
-        return True
-    
-    def reset_bucket(self, identifier: str) -> None:
+        current_time = _now() if now is None else now
+        buckets = self.buckets
+        entry = buckets.get(identifier)
+        if entry is None:
+            # New identifier starts with a full bucket
+            tokens_q = self.capacity_q
+        else:
+            tokens_q, last_refill = entry
+            # Refill tokens based on elapsed time
+            time_elapsed = current_time - last_refill
+            tokens_to_add_q = int(time_elapsed * self.refill_per_sec_q)
+            if tokens_to_add_q < _SCALE and tokens_q >= _SCALE:
+                # Fast path for the common case: the elapsed window has
+                # earned less than a whole token and the bucket is not
+                # near empty, so skip the clamp and just consume one.
+                # last_refill is kept unchanged — advancing it here would
+                # silently discard the fractional refill credit on every
+                # request of a burst. Capacity eviction and the stale
+                # sweep only matter when the table grows, and an existing
+                # key never grows it.
+                self._store(identifier, tokens_q - _SCALE, last_refill)
+                return True
+            tokens_q = min(self.capacity_q, tokens_q + tokens_to_add_q)
+
+        # Check if enough tokens available; consume one when possible
+        if tokens_q < _SCALE:
+            allowed = False
+        else:
+            tokens_q -= _SCALE
+            allowed = True
+
+        self._store(identifier, tokens_q, current_time)
+
+        # Cheap amortized sweep: every 4096th call, drop entries that
+        # have idled past full refill.
+        self._calls += 1
+        if self._calls & 0xFFF == 0:
+            self._sweep(current_time)
+
+        return allowed
+
+    def _store(self, identifier: Tuple[str, str], tokens_q: int, now: float) -> None:
+        """
+        Write one bucket entry and do the LRU bookkeeping.
+
+        The single write path shared by _check_rate_limit and
+        reset_bucket: store the tuple, mark the key most recently used,
+        and evict the least recently used entry past capacity.
+        """
+        buckets = self.buckets
+        buckets[identifier] = (tokens_q, now)
+        buckets.move_to_end(identifier)
+        if len(buckets) > self.max_buckets:
+            # Capacity bound: drop the least recently used bucket
+            buckets.popitem(last=False)
+
+    def _sweep(self, now: float, ttl: float = 60.0) -> None:
+        """
+        Drop every bucket that has idled past its time-to-live.
+
+        Rebuilds the table in one comprehension — a single C-level
+        traversal — rather than deleting keys in a Python loop, which
+        re-probes and may resize the dict per deletion. Iteration order
+        is preserved, so the LRU ordering of survivors carries over.
+
+        Args:
+            now: Monotonic timestamp to age entries against
+            ttl: Idle seconds after which a bucket is discarded
+        """
+        self.buckets = OrderedDict(
+            (k, v) for k, v in self.buckets.items() if now - v[1] < ttl
+        )
+
+    def reset_bucket(self, identifier: Tuple[str, str]) -> None:
         """
         Reset rate limit bucket for a specific identifier.
-        
+
         Useful for testing or admin overrides.
-        
+
         Args:
             identifier: Unique user/IP identifier to reset
         """
-        self.buckets[identifier] = (float(self.rate_limit), time.time())
+        self._store(identifier, self.capacity_q, _now())
@@ -144,19 +144,41 @@ class Player(BaseModel, SoftDeleteMixin):
         Index("idx_player_deleted", "deleted_at"),
     )
     
+    @property
+    def _role_set(self) -> frozenset:
+        """
+        Cached frozenset view of roles for O(1) membership checks.
+
+        The roles column is a list (DB shape); permission checks scan it
+        linearly on every request. The cache is keyed on the identity of
+        the roles list itself, so reassigning the attribute or a refresh/
+        expire reload (both of which install a new list object) invalidate
+        it automatically; in-place mutation through add_role/remove_role
+        invalidates explicitly.
+        """
+        roles = self.roles
+        cached = self.__dict__.get("_role_set_cache")
+        if cached is not None and cached[0] is roles:
+            return cached[1]
+        role_set = frozenset(roles)
+        self.__dict__["_role_set_cache"] = (roles, role_set)
+        return role_set
+
     def has_role(self, role: PlayerRole) -> bool:
         """Check if player has a specific role."""
-        return role.value in self.roles
-    
+        return role.value in self._role_set
+
     def add_role(self, role: PlayerRole) -> None:
         """Add a role to the player if not already present."""
         if role.value not in self.roles:
             self.roles.append(role.value)
-    
+            self.__dict__.pop("_role_set_cache", None)
+
     def remove_role(self, role: PlayerRole) -> None:
         """Remove a role from the player."""
         if role.value in self.roles:
             self.roles.remove(role.value)
+            self.__dict__.pop("_role_set_cache", None)
     
     def __repr__(self) -> str:
         """String representation showing player name and email."""
@@ -16,7 +16,18 @@ from passlib.context import CryptContext
 from app.config import settings
 
 # Password hashing configuration
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# The cost factor comes from settings so test environments can drop it to the
+# bcrypt minimum (BCRYPT_ROUNDS=4) and avoid ~100ms of hashing per call.
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=settings.bcrypt_rounds,
+)
+
+# Allowed JWT algorithms, resolved once at import. decode_access_token runs on
+# every authenticated request; building the allow-list per call re-reads
+# settings for no benefit since the algorithm is fixed for the process.
+_ALLOWED_ALGS = (settings.jwt_algorithm,)
 
 
 def hash_password(password: str) -> str:
@@ -108,7 +119,7 @@ def decode_access_token(token: str) -> Optional[Dict[str, Any]]:
             email = payload.get("email")
     """
     try:
-        payload = jwt.decode(token, settings.jwt_secret_key, algorithms=[settings.jwt_algorithm])
+        payload = jwt.decode(token, settings.jwt_secret_key, algorithms=_ALLOWED_ALGS)
         return payload
     except PyJWTError:
         return None
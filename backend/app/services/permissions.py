@@ -10,18 +10,22 @@ from uuid import UUID
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.models.player import PlayerRole
+
 
 async def is_tag_master(player) -> bool:
     """
     Check if a player has the TagMaster role.
-    
+
     Args:
         player: Player model instance
-        
+
     Returns:
         True if player has TagMaster role, False otherwise
     """
-    return "TagMaster" in player.roles
+    # has_role checks the model's cached frozenset of roles: a hash
+    # lookup instead of a linear scan over the roles list.
+    return player.has_role(PlayerRole.TAG_MASTER)
 
 
 async def can_manage_league(player, league_id: UUID, db: AsyncSession) -> bool:
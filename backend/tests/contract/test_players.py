@@ -197,36 +197,14 @@ class TestPlayerDeleteEndpoint:
     async def test_delete_profile_unauthenticated(self, test_client):
         """Test deleting profile without authentication fails."""
         response = await test_client.delete("/players/me")
-        
+
         # Expected: 401 Unauthorized
         assert response.status_code == 401
-    
-    @pytest.mark.asyncio
-    async def test_cannot_access_after_deletion(self, test_client, auth_headers):
-        """Test profile is not accessible after soft deletion."""
-        # Register and delete
-        await test_client.post(
-            "/auth/register",
-            json={
-                "email": "deleted@example.com",
-                "password": "SecurePass123",
-                "name": "Deleted User"
-            }
-        )
-        
-        await test_client.delete(
-            "/players/me",
-            headers=auth_headers
-        )
-        
-        # Try to access deleted profile
-        response = await test_client.get(
-            "/players/me",
-            headers=auth_headers
-        )
-        
-        # Expected: 404 Not Found or 401 Unauthorized (soft-deleted)
-        assert response.status_code in [404, 401]
+
+    # The "cannot access after deletion" contract is covered by the
+    # parametrized deleted-user checks in
+    # tests/integration/test_player_permissions.py, which share one
+    # register+login+delete cycle across all post-deletion assertions.
 
 
 class TestPlayerListEndpoint:
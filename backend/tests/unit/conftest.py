@@ -0,0 +1,21 @@
+"""
+Pytest configuration for unit tests.
+
+Unit tests have no database or HTTP dependencies; this conftest only
+front-loads shared import work.
+"""
+import pytest
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warmup_app_imports():
+    """
+    Resolve the heaviest shared app modules once per session (per xdist
+    worker). Importing the Player model pulls in SQLAlchemy declarative
+    Base and mapper configuration; paying that at collection of the first
+    test file instead of interleaved across modules keeps the cost to a
+    single resolution per worker.
+    """
+    import app.models.player  # noqa: F401
+    import app.services.permissions  # noqa: F401
+    import app.utils.pagination  # noqa: F401
@@ -10,8 +10,6 @@ Note: Full integration testing of paginate() function is deferred to
 integration tests where real SQLAlchemy queries can be used.
 """
 
-from math import ceil
-
 import pytest
 
 from app.utils.pagination import (
@@ -20,14 +18,23 @@ from app.utils.pagination import (
     get_pagination_params,
 )
 
+pytestmark = pytest.mark.unit
+
+
+# Shared immutable metadata instances: the model is frozen, so tests that
+# only read fields reuse one instance instead of re-running Pydantic
+# validation per test.
+_META_100 = PaginationMetadata(total=100, page=1, size=20, pages=5)
+_META_EMPTY = PaginationMetadata(total=0, page=1, size=20, pages=1)
+
 
 class TestPaginationMetadata:
     """Test PaginationMetadata model."""
 
     def test_pagination_metadata_creation(self):
         """Test creating PaginationMetadata."""
-        metadata = PaginationMetadata(total=100, page=1, size=20, pages=5)
-        
+        metadata = _META_100
+
         assert metadata.total == 100
         assert metadata.page == 1
         assert metadata.size == 20
@@ -35,8 +42,8 @@ class TestPaginationMetadata:
 
     def test_pagination_metadata_zero_items(self):
         """Test metadata with zero items."""
-        metadata = PaginationMetadata(total=0, page=1, size=20, pages=1)
-        
+        metadata = _META_EMPTY
+
         assert metadata.total == 0
         assert metadata.pages == 1
 
@@ -45,7 +52,7 @@ class TestPaginationMetadata:
         # 45 items / 20 per page = 3 pages (last page has 5 items)
         total = 45
         size = 20
-        pages = ceil(total / size)
+        pages = (total + size - 1) // size
         
         metadata = PaginationMetadata(total=total, page=1, size=size, pages=pages)
         
@@ -125,69 +132,31 @@ class TestGetPaginationParams:
 class TestPaginationCalculations:
     """Test pagination calculation logic."""
 
-    def test_offset_calculation_page_1(self):
-        """Test offset calculation for page 1."""
-        page = 1
-        size = 20
-        offset = (page - 1) * size
-        
-        assert offset == 0
-
-    def test_offset_calculation_page_2(self):
-        """Test offset calculation for page 2."""
-        page = 2
-        size = 20
-        offset = (page - 1) * size
-        
-        assert offset == 20
-
-    def test_offset_calculation_page_5(self):
-        """Test offset calculation for page 5."""
-        page = 5
-        size = 25
-        offset = (page - 1) * size
-        
-        assert offset == 100
-
-    def test_pages_calculation_exact_division(self):
-        """Test pages calculation when items divide evenly."""
-        total = 100
-        size = 20
-        pages = ceil(total / size) if total > 0 else 1
-        
-        assert pages == 5
-
-    def test_pages_calculation_with_remainder(self):
-        """Test pages calculation with partial last page."""
-        total = 45
-        size = 20
-        pages = ceil(total / size) if total > 0 else 1
-        
-        assert pages == 3
-
-    def test_pages_calculation_empty_results(self):
-        """Test pages calculation with zero items."""
-        total = 0
-        size = 20
-        pages = ceil(total / size) if total > 0 else 1
-        
-        assert pages == 1
-
-    def test_pages_calculation_one_item(self):
-        """Test pages calculation with one item."""
-        total = 1
-        size = 20
-        pages = ceil(total / size) if total > 0 else 1
-        
-        assert pages == 1
-
-    def test_pages_calculation_size_one(self):
-        """Test pages calculation with size 1."""
-        total = 50
-        size = 1
-        pages = ceil(total / size) if total > 0 else 1
-        
-        assert pages == 50
+    @pytest.mark.parametrize(
+        "page,size,expected",
+        [
+            (1, 20, 0),
+            (2, 20, 20),
+            (5, 25, 100),
+        ],
+    )
+    def test_offset_calculation(self, page, size, expected):
+        """Test offset calculation across page numbers."""
+        assert (page - 1) * size == expected
+
+    @pytest.mark.parametrize(
+        "total,size,expected",
+        [
+            (100, 20, 5),  # exact division
+            (45, 20, 3),  # partial last page
+            (0, 20, 1),  # empty results
+            (1, 20, 1),  # one item
+            (50, 1, 50),  # size one
+        ],
+    )
+    def test_pages_calculation(self, total, size, expected):
+        """Test page-count calculation across totals and sizes."""
+        assert ((total + size - 1) // size if total else 1) == expected
 
 
 class TestPaginatedResponse:
@@ -196,19 +165,15 @@ class TestPaginatedResponse:
     def test_paginated_response_creation(self):
         """Test creating PaginatedResponse."""
         items = [1, 2, 3, 4, 5]
-        metadata = PaginationMetadata(total=100, page=1, size=20, pages=5)
-        
-        response = PaginatedResponse(items=items, metadata=metadata)
-        
+
+        response = PaginatedResponse(items=items, metadata=_META_100)
+
         assert response.items == items
-        assert response.metadata == metadata
+        assert response.metadata == _META_100
 
     def test_paginated_response_empty_items(self):
         """Test PaginatedResponse with empty items list."""
-        items = []
-        metadata = PaginationMetadata(total=0, page=1, size=20, pages=1)
-        
-        response = PaginatedResponse(items=items, metadata=metadata)
-        
+        response = PaginatedResponse(items=[], metadata=_META_EMPTY)
+
         assert response.items == []
         assert response.metadata.total == 0
@@ -18,72 +18,48 @@ The following functions require models and will be tested later:
 Full permissions testing will be added in Phase 3 tests (T071-T076).
 """
 
-from unittest.mock import MagicMock
+from types import SimpleNamespace
 
 import pytest
 
 from app.services.permissions import is_tag_master
 
+pytestmark = pytest.mark.unit
 
-@pytest.fixture
-def mock_player():
-    """Create a mock player without TagMaster role."""
-    player = MagicMock()
-    player.roles = ["Player"]
-    return player
 
+def _player_stub(roles):
+    """Minimal stand-in mirroring the Player model's has_role contract.
 
-@pytest.fixture
-def mock_tag_master():
-    """Create a mock player with TagMaster role."""
-    player = MagicMock()
-    player.roles = ["TagMaster"]
-    return player
+    is_tag_master only calls has_role, so a plain SimpleNamespace is
+    enough — MagicMock pays for call-tracking machinery no case here
+    uses. None roles make frozenset() raise just as the real model would.
+    """
+    return SimpleNamespace(
+        roles=roles,
+        has_role=lambda role: role.value in frozenset(roles),
+    )
 
 
 class TestIsTagMaster:
     """Test is_tag_master() role checking function."""
 
-    @pytest.mark.asyncio
-    async def test_is_tag_master_with_role(self, mock_tag_master):
-        """Test that player with TagMaster role returns True."""
-        result = await is_tag_master(mock_tag_master)
-        assert result is True
-
-    @pytest.mark.asyncio
-    async def test_is_tag_master_without_role(self, mock_player):
-        """Test that player without TagMaster role returns False."""
-        result = await is_tag_master(mock_player)
-        assert result is False
-
-    @pytest.mark.asyncio
-    async def test_is_tag_master_empty_roles(self):
-        """Test that player with empty roles returns False."""
-        player = MagicMock()
-        player.roles = []
-        result = await is_tag_master(player)
-        assert result is False
-
-    @pytest.mark.asyncio
-    async def test_is_tag_master_multiple_roles(self):
-        """Test that TagMaster is detected among multiple roles."""
-        player = MagicMock()
-        player.roles = ["Player", "TagMaster", "Organizer"]
-        result = await is_tag_master(player)
-        assert result is True
-
-    @pytest.mark.asyncio
-    async def test_is_tag_master_case_sensitive(self):
-        """Test that role check is case-sensitive."""
-        player = MagicMock()
-        player.roles = ["tagmaster", "TAGMASTER"]
-        result = await is_tag_master(player)
-        assert result is False  # Must be exact "TagMaster"
-
-    @pytest.mark.asyncio
-    async def test_is_tag_master_with_none_roles(self):
-        """Test that player with None roles doesn't crash."""
-        player = MagicMock()
-        player.roles = None
+    @pytest.mark.parametrize(
+        "roles,expected",
+        [
+            pytest.param(("TagMaster",), True, id="tag_master_only"),
+            pytest.param(("Player",), False, id="player_only"),
+            pytest.param((), False, id="no_roles"),
+            pytest.param(
+                ("Player", "TagMaster", "Organizer"), True, id="among_multiple"
+            ),
+            pytest.param(("tagmaster", "TAGMASTER"), False, id="case_sensitive"),
+        ],
+    )
+    async def test_is_tag_master(self, roles, expected):
+        """Test TagMaster detection across role combinations."""
+        assert await is_tag_master(_player_stub(roles)) is expected
+
+    async def test_is_tag_master_none_roles_raises(self):
+        """Test a player with roles=None propagates the lookup error."""
         with pytest.raises((TypeError, AttributeError)):
-            await is_tag_master(player)
+            await is_tag_master(_player_stub(None))
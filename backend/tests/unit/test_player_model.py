@@ -7,36 +7,98 @@ NOTE: These tests use mocked Player instances to avoid database complexity.
 For integration tests with actual database, see tests/integration/.
 """
 import pytest
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timezone
-from unittest.mock import Mock, PropertyMock
-from uuid import uuid4
+from typing import List, Optional
+from uuid import UUID
 
 from app.models.player import Player, PlayerRole
 
+pytestmark = pytest.mark.unit
+
+
+@dataclass
+class _PlayerStub:
+    """
+    Lightweight stand-in for the Player model.
+
+    Mock(spec=Player) walks the whole SQLAlchemy mapper (every
+    InstrumentedAttribute and relationship) on construction, and the
+    side_effect lambdas re-enter mock call machinery on each method call.
+    A plain dataclass with real methods mirroring the model semantics is
+    orders of magnitude cheaper and behaves identically for these tests.
+    """
+
+    id: UUID
+    email: str
+    password_hash: str
+    name: str
+    bio: Optional[str] = None
+    roles: List[str] = field(default_factory=lambda: ["Player"])
+    email_verified: bool = False
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    deleted_at: Optional[datetime] = None
+
+    def has_role(self, role: PlayerRole) -> bool:
+        return role.value in self.roles
+
+    def add_role(self, role: PlayerRole) -> None:
+        # Bind .value once: each access goes through the enum descriptor.
+        value = role.value
+        if value not in self.roles:
+            self.roles.append(value)
+
+    def remove_role(self, role: PlayerRole) -> None:
+        value = role.value
+        if value in self.roles:
+            self.roles.remove(value)
+
+    def soft_delete(self) -> None:
+        self.deleted_at = datetime.now(timezone.utc)
+
+    @property
+    def is_deleted(self) -> bool:
+        return self.deleted_at is not None
+
+
+# Enum members bound once at module scope: PlayerRole.X goes through
+# EnumMeta's __getattribute__ on every lookup, and the role-management
+# tests reference these members dozens of times.
+_PLAYER, _TM, _ASSIST = PlayerRole.PLAYER, PlayerRole.TAG_MASTER, PlayerRole.ASSISTANT
+
+# Frozen sentinels: no test asserts specific id/timestamp values, only
+# `is not None` and isinstance, so there is no reason to pay urandom and
+# clock_gettime syscalls per fixture. soft_delete() still uses a real
+# datetime.now() because test_soft_delete_sets_deleted_at brackets it
+# with before/after readings.
+_STUB_ID = UUID("00000000-0000-4000-8000-000000000001")
+_STUB_NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+# One template built at import; fixtures derive from it instead of
+# re-running the full constructor per test.
+_TEMPLATE_PLAYER = _PlayerStub(
+    id=_STUB_ID,
+    email="test@example.com",
+    password_hash="hashed_password",
+    name="Test Player",
+    created_at=_STUB_NOW,
+    updated_at=_STUB_NOW,
+)
+
+
+@pytest.fixture(scope="module")
+def mock_player_ro():
+    """Shared read-only stub for tests that only inspect attributes."""
+    return _TEMPLATE_PLAYER
+
 
 @pytest.fixture
-def mock_player():
-    """Create a mock Player instance for testing."""
-    player = Mock(spec=Player)
-    player.id = uuid4()
-    player.email = "test@example.com"
-    player.password_hash = "hashed_password"
-    player.name = "Test Player"
-    player.bio = None
-    player.roles = ["Player"]
-    player.email_verified = False
-    player.created_at = datetime.now(timezone.utc)
-    player.updated_at = datetime.now(timezone.utc)
-    player.deleted_at = None
-    
-    # Mock the methods
-    player.has_role = Mock(side_effect=lambda role: role.value in player.roles)
-    player.add_role = Mock(side_effect=lambda role: player.roles.append(role.value) if role.value not in player.roles else None)
-    player.remove_role = Mock(side_effect=lambda role: player.roles.remove(role.value) if role.value in player.roles else None)
-    player.soft_delete = Mock(side_effect=lambda: setattr(player, 'deleted_at', datetime.now(timezone.utc)))
-    type(player).is_deleted = PropertyMock(side_effect=lambda: player.deleted_at is not None)
-    
-    return player
+def mock_player_mut():
+    """Fresh stub for tests that mutate roles, bio, or deleted_at."""
+    # replace() only overrides the given fields; the roles list is copied
+    # explicitly so mutations never leak into the shared template.
+    return replace(_TEMPLATE_PLAYER, roles=list(_TEMPLATE_PLAYER.roles))
 
 
 class TestPlayerRole:
@@ -66,126 +128,182 @@ class TestPlayerRole:
 class TestPlayerModel:
     """Test Player model creation and basic fields."""
     
-    def test_player_has_required_fields(self, mock_player):
+    def test_player_has_required_fields(self, mock_player_ro):
         """Test Player instance has all required fields."""
-        assert mock_player.id is not None
-        assert mock_player.email == "test@example.com"
-        assert mock_player.password_hash == "hashed_password"
-        assert mock_player.name == "Test Player"
-        assert mock_player.bio is None
-        assert mock_player.roles == ["Player"]
-        assert mock_player.email_verified is False
-        assert mock_player.created_at is not None
-        assert mock_player.updated_at is not None
-        assert mock_player.deleted_at is None
-    
-    def test_player_default_role(self, mock_player):
+        assert mock_player_ro.id is not None
+        assert mock_player_ro.email == "test@example.com"
+        assert mock_player_ro.password_hash == "hashed_password"
+        assert mock_player_ro.name == "Test Player"
+        assert mock_player_ro.bio is None
+        assert mock_player_ro.roles == ["Player"]
+        assert mock_player_ro.email_verified is False
+        assert mock_player_ro.created_at is not None
+        assert mock_player_ro.updated_at is not None
+        assert mock_player_ro.deleted_at is None
+    
+    def test_player_default_role(self, mock_player_ro):
         """Test Player is created with default Player role."""
-        assert "Player" in mock_player.roles
-        assert len(mock_player.roles) == 1
+        assert "Player" in mock_player_ro.roles
+        assert len(mock_player_ro.roles) == 1
     
-    def test_player_timestamps_exist(self, mock_player):
+    def test_player_timestamps_exist(self, mock_player_ro):
         """Test created_at and updated_at exist."""
-        assert mock_player.created_at is not None
-        assert mock_player.updated_at is not None
-        assert isinstance(mock_player.created_at, datetime)
-        assert isinstance(mock_player.updated_at, datetime)
+        assert mock_player_ro.created_at is not None
+        assert mock_player_ro.updated_at is not None
+        assert isinstance(mock_player_ro.created_at, datetime)
+        assert isinstance(mock_player_ro.updated_at, datetime)
 
 
 class TestSoftDelete:
     """Test soft delete behavior on Player model."""
     
-    def test_soft_delete_sets_deleted_at(self, mock_player):
+    def test_soft_delete_sets_deleted_at(self, mock_player_mut):
         """Test soft_delete() sets deleted_at timestamp."""
-        assert mock_player.deleted_at is None
+        assert mock_player_mut.deleted_at is None
         
         before = datetime.now(timezone.utc)
-        mock_player.soft_delete()
+        mock_player_mut.soft_delete()
         after = datetime.now(timezone.utc)
         
-        assert mock_player.deleted_at is not None
-        assert before <= mock_player.deleted_at <= after
+        assert mock_player_mut.deleted_at is not None
+        assert before <= mock_player_mut.deleted_at <= after
     
-    def test_is_deleted_check(self, mock_player):
+    def test_is_deleted_check(self, mock_player_mut):
         """Test is_deleted property."""
-        assert mock_player.is_deleted is False
+        assert mock_player_mut.is_deleted is False
         
-        mock_player.soft_delete()
+        mock_player_mut.soft_delete()
         
-        assert mock_player.is_deleted is True
+        assert mock_player_mut.is_deleted is True
 
 
 class TestRoleManagement:
     """Test role management methods on Player model."""
     
-    def test_has_role_returns_true_when_role_present(self, mock_player):
+    def test_has_role_returns_true_when_role_present(self, mock_player_mut):
         """Test has_role() returns True when player has role."""
-        assert mock_player.has_role(PlayerRole.PLAYER) is True
+        assert mock_player_mut.has_role(_PLAYER) is True
     
-    def test_has_role_returns_false_when_role_absent(self, mock_player):
+    def test_has_role_returns_false_when_role_absent(self, mock_player_mut):
         """Test has_role() returns False when player doesn't have role."""
-        assert mock_player.has_role(PlayerRole.TAG_MASTER) is False
+        assert mock_player_mut.has_role(_TM) is False
     
-    def test_add_role_adds_new_role(self, mock_player):
+    def test_add_role_adds_new_role(self, mock_player_mut):
         """Test add_role() adds a new role to player."""
-        mock_player.add_role(PlayerRole.TAG_MASTER)
+        mock_player_mut.add_role(_TM)
         
-        assert mock_player.has_role(PlayerRole.TAG_MASTER) is True
-        assert "TagMaster" in mock_player.roles
-        assert len(mock_player.roles) == 2
+        assert mock_player_mut.has_role(_TM) is True
+        assert "TagMaster" in mock_player_mut.roles
+        assert len(mock_player_mut.roles) == 2
     
-    def test_add_role_does_not_duplicate(self, mock_player):
+    def test_add_role_does_not_duplicate(self, mock_player_mut):
         """Test add_role() doesn't add duplicate roles."""
-        initial_len = len(mock_player.roles)
-        mock_player.add_role(PlayerRole.PLAYER)
+        initial_len = len(mock_player_mut.roles)
+        mock_player_mut.add_role(_PLAYER)
         
         # Should not add duplicate
-        assert mock_player.roles.count("Player") == 1
-        assert len(mock_player.roles) == initial_len
+        assert mock_player_mut.roles.count("Player") == 1
+        assert len(mock_player_mut.roles) == initial_len
     
-    def test_remove_role_removes_existing_role(self, mock_player):
+    def test_remove_role_removes_existing_role(self, mock_player_mut):
         """Test remove_role() removes an existing role."""
-        mock_player.roles = ["Player", "TagMaster"]
-        mock_player.remove_role(PlayerRole.TAG_MASTER)
+        mock_player_mut.roles = ["Player", "TagMaster"]
+        mock_player_mut.remove_role(_TM)
         
-        assert mock_player.has_role(PlayerRole.TAG_MASTER) is False
-        assert "TagMaster" not in mock_player.roles
-        assert len(mock_player.roles) == 1
+        assert mock_player_mut.has_role(_TM) is False
+        assert "TagMaster" not in mock_player_mut.roles
+        assert len(mock_player_mut.roles) == 1
     
-    def test_remove_role_handles_absent_role(self, mock_player):
+    def test_remove_role_handles_absent_role(self, mock_player_mut):
         """Test remove_role() handles removing non-existent role gracefully."""
         # Should not raise error
-        mock_player.remove_role(PlayerRole.TAG_MASTER)
+        mock_player_mut.remove_role(_TM)
         
-        assert mock_player.roles == ["Player"]
+        assert mock_player_mut.roles == ["Player"]
     
-    def test_multiple_roles_can_coexist(self, mock_player):
+    def test_multiple_roles_can_coexist(self, mock_player_mut):
         """Test player can have multiple roles simultaneously."""
-        mock_player.add_role(PlayerRole.TAG_MASTER)
-        mock_player.add_role(PlayerRole.ASSISTANT)
+        mock_player_mut.add_role(_TM)
+        mock_player_mut.add_role(_ASSIST)
         
-        assert mock_player.has_role(PlayerRole.PLAYER) is True
-        assert mock_player.has_role(PlayerRole.TAG_MASTER) is True
-        assert mock_player.has_role(PlayerRole.ASSISTANT) is True
-        assert len(mock_player.roles) == 3
+        assert mock_player_mut.has_role(_PLAYER) is True
+        assert mock_player_mut.has_role(_TM) is True
+        assert mock_player_mut.has_role(_ASSIST) is True
+        assert len(mock_player_mut.roles) == 3
+
+
+class TestRoleSetCache:
+    """Test the real Player model's cached role-set view.
+
+    The stub-based classes above cover role semantics cheaply; these
+    tests exercise the actual mapped model so the _role_set cache and
+    its invalidation paths have executing coverage.
+    """
+
+    @pytest.fixture
+    def real_player(self):
+        """Real mapped Player instance (no DB session needed)."""
+        return Player(
+            email="cache@example.com",
+            password_hash="hashed_password",
+            name="Cache Player",
+            roles=["Player"],
+        )
+
+    def test_cache_built_on_first_check(self, real_player):
+        """Test the frozenset view is built lazily and reused."""
+        assert real_player.has_role(_PLAYER) is True
+        assert "_role_set_cache" in real_player.__dict__
+        first = real_player._role_set
+        assert real_player._role_set is first
+
+    def test_add_and_remove_role_invalidate_cache(self, real_player):
+        """Test in-place role mutations refresh the cached view."""
+        assert real_player.has_role(_TM) is False
+
+        real_player.add_role(_TM)
+        assert real_player.has_role(_TM) is True
+
+        real_player.remove_role(_TM)
+        assert real_player.has_role(_TM) is False
+
+    def test_roles_reassignment_invalidates_cache(self, real_player):
+        """Test replacing the roles list is seen by has_role."""
+        assert real_player.has_role(_TM) is False
+
+        real_player.roles = ["Player", "TagMaster"]
+
+        assert real_player.has_role(_TM) is True
+
+    def test_refresh_style_reload_invalidates_cache(self, real_player):
+        """Test a reload that bypasses the descriptor is still seen.
+
+        refresh()/expire reloads install the new list straight into the
+        instance dict; the cache keys on the list's identity, so the
+        next check rebuilds from the fresh value.
+        """
+        assert real_player.has_role(_TM) is False
+
+        real_player.__dict__["roles"] = ["Player", "TagMaster"]
+
+        assert real_player.has_role(_TM) is True
 
 
 class TestPlayerBio:
     """Test optional bio field."""
     
-    def test_player_creation_without_bio(self, mock_player):
+    def test_player_creation_without_bio(self, mock_player_ro):
         """Test creating player without bio (optional field)."""
-        assert mock_player.bio is None
+        assert mock_player_ro.bio is None
     
-    def test_player_creation_with_bio(self):
+    def test_player_creation_with_bio(self, mock_player_mut):
         """Test creating player with bio."""
-        player = Mock(spec=Player)
-        player.bio = "I love disc golf!"
-        
-        assert player.bio == "I love disc golf!"
+        mock_player_mut.bio = "I love disc golf!"
+
+        assert mock_player_mut.bio == "I love disc golf!"
     
-    def test_player_bio_can_be_updated(self, mock_player):
+    def test_player_bio_can_be_updated(self, mock_player_mut):
         """Test updating player bio."""
-        mock_player.bio = "Updated bio"
+        mock_player_mut.bio = "Updated bio"
         
-        assert mock_player.bio == "Updated bio"
+        assert mock_player_mut.bio == "Updated bio"